@@ -7,7 +7,7 @@ from typing import Optional
 
 CONFIG_PATH = os.path.expanduser("~/.claude-voice/config.yaml")
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InputConfig:
     hotkey: str = "right_alt"
     language_hotkey: Optional[str] = None
@@ -17,7 +17,7 @@ class InputConfig:
     smart_insert: bool = True
     debug: bool = False
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranscriptionConfig:
     model: str = "mlx-community/parakeet-tdt-0.6b-v2"
     language: str = "en"
@@ -43,7 +43,7 @@ DEFAULT_NOTIFY_PHRASES = {
 NOTIFY_PHRASES_BY_LANG = {
 }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpeechConfig:
     enabled: bool = True
     mode: str = "notify"                   # "notify" or "narrate"
@@ -61,17 +61,17 @@ class SpeechConfig:
     notify_phrases: Optional[dict] = None  # Custom phrase overrides
     hotkey: Optional[str] = "left_alt+v"   # Toggle voice on/off
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     input_device: Optional[int] = None
     sample_rate: int = 16000
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OverlayConfig:
     enabled: bool = True
     style: str = "dark"  # "dark", "frosted", or "colored"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     input: InputConfig
     transcription: TranscriptionConfig
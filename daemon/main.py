@@ -43,6 +43,17 @@ SILENT_FLAG = os.path.expanduser("~/.claude-voice/.silent")
 TTS_SOCK_PATH = os.path.expanduser("~/.claude-voice/.tts.sock")
 ASK_USER_FLAG = os.path.expanduser("/tmp/claude-voice/.ask_user_active")
 
+# Stripped from the end of a transcript before matching voice commands
+_TRAILING_PUNCT = ".?! \t\r\n"
+
+# Spoken command (casefolded, no trailing punctuation) -> voice output enabled
+_VOICE_COMMANDS: dict[str, bool] = {
+    "stop speaking": False,
+    "stop talking": False,
+    "start speaking": True,
+    "start talking": True,
+}
+
 # Audio cue frequency patterns
 CUE_ASCENDING = [440, 660, 880]
 CUE_DESCENDING = [880, 660, 440]
@@ -319,6 +330,8 @@ class VoiceDaemon:
         )
         if engine_changed:
             self.tts_engine.stop_playback()
+            if hasattr(self.tts_engine, 'close'):
+                self.tts_engine.close()
             self.tts_engine = create_tts_engine(
                 engine=new.speech.engine,
                 api_key=new.speech.openai_api_key,
@@ -404,23 +417,12 @@ class VoiceDaemon:
 
     def _handle_voice_command(self, text: str) -> bool:
         """Check for voice commands. Returns True if command was handled."""
-        text_lower = text.lower().strip().rstrip('.')
-
-        # Stop speaking commands
-        if text_lower in ["stop speaking", "stop talking"]:
-            with open(SILENT_FLAG, 'w') as f:
-                pass
-            print("Voice output disabled")
-            return True
-
-        # Start speaking commands
-        if text_lower in ["start speaking", "start talking"]:
-            if os.path.exists(SILENT_FLAG):
-                os.remove(SILENT_FLAG)
-            print("Voice output enabled")
-            return True
-
-        return False
+        enabled = _VOICE_COMMANDS.get(text.casefold().lstrip().rstrip(_TRAILING_PUNCT))
+        if enabled is None:
+            return False
+        self.set_voice_enabled(enabled)
+        print(f"Voice output {'enabled' if enabled else 'disabled'}")
+        return True
 
     def _toggle_voice(self) -> None:
         """Toggle voice output on/off via speech hotkey."""
@@ -487,7 +489,9 @@ class VoiceDaemon:
                 lang_code = request.get("lang_code", self.config.speech.lang_code)
 
                 if text:
-                    mode = _read_mode()
+                    # config is kept current by set_mode/reload_config, so
+                    # don't re-parse config.yaml on every request
+                    mode = _read_mode(self.config)
                     if mode == "notify":
                         category = classify(text)
                         print(f"Notify: {category}")
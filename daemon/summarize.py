@@ -24,40 +24,88 @@ Output ONLY the summary. No preamble, no "Sure", no "Here's a summary".""",
 # Minimum text length to bother summarizing (chars)
 MIN_TEXT_LENGTH = 20
 
-
-def filter_for_summarization(text: str) -> str:
-    """Remove code, paths, and technical noise before summarization."""
-    if not text:
-        return text
-
+# LLM preamble prefixes stripped from summaries (lowercase, checked in order)
+_PREAMBLE_PREFIXES = ("summary:", "output:", "here's", "sure,", "sure!", "sure.",
+                      "here is", "here are")
+
+
+# Separator for filter_for_summarization_batch. The filter patterns never
+# match across a NUL and treat it like the start/end of the text.
+_BATCH_SEP = "\x00"
+_START = r'(?:^|(?<=\x00))'  # Start of text (or line, with re.MULTILINE)
+_END = r'(?:$|(?=\x00))'     # End of text
+
+# Pre-compiled filter patterns
+_CODE_BLOCK_RE = re.compile(r'```[^\x00]*?```')
+_INLINE_CODE_RE = re.compile(r'`[^`\x00]+`')
+_PATH_RE = re.compile(rf'(?:{_START}|\s)[/~][\w./-]+(?:\s|{_END})')
+_FILENAME_RE = re.compile(r'\b\w+\.(py|js|ts|tsx|go|rs|java|cpp|c|h|md|yaml|json|toml)\b')
+_STACK_TRACE_RE = re.compile(rf'{_START}\s*(at |File |Traceback)[^\n\x00]*', re.MULTILINE)
+_HEX_RE = re.compile(r'\b0x[0-9a-fA-F]+\b')
+_ERROR_CODE_RE = re.compile(r'\berror\s*[:-]?\s*\d+\b', re.IGNORECASE)
+_BOLD_RE = re.compile(r'\*\*([^*\x00]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*\x00]+)\*')
+_HEADER_RE = re.compile(rf'{_START}#+\s*', re.MULTILINE)
+_LIST_ITEM_RE = re.compile(rf'{_START}\s*[-*]\s+', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n{2,}')
+_SPACES_RE = re.compile(r' {2,}')
+
+
+def _strip_technical_noise(text: str) -> str:
+    """Apply the summarization filters to text (no final strip)."""
     # Remove code blocks (```...```)
-    text = re.sub(r'```[\s\S]*?```', '', text)
+    text = _CODE_BLOCK_RE.sub('', text)
 
     # Remove inline code (`...`)
-    text = re.sub(r'`[^`]+`', '', text)
+    text = _INLINE_CODE_RE.sub('', text)
 
-    # Remove file paths (common patterns)
-    text = re.sub(r'(?:^|\s)[/~][\w./-]+(?:\s|$)', ' ', text)
-    text = re.sub(r'\b\w+\.(py|js|ts|tsx|go|rs|java|cpp|c|h|md|yaml|json|toml)\b', '', text)
+    # Remove file paths (common patterns); skip the regexes when no path can match
+    if '/' in text or '~' in text:
+        text = _PATH_RE.sub(' ', text)
+    if '.' in text:
+        text = _FILENAME_RE.sub('', text)
 
     # Remove stack traces (lines starting with "at " or "File ")
-    text = re.sub(r'^\s*(at |File |Traceback).*$', '', text, flags=re.MULTILINE)
+    text = _STACK_TRACE_RE.sub('', text)
 
     # Remove error codes and hex addresses
-    text = re.sub(r'\b0x[0-9a-fA-F]+\b', '', text)
-    text = re.sub(r'\berror\s*[:-]?\s*\d+\b', '', text, flags=re.IGNORECASE)
+    text = _HEX_RE.sub('', text)
+    text = _ERROR_CODE_RE.sub('', text)
 
     # Remove markdown formatting
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-    text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)  # Headers
-    text = re.sub(r'^\s*[-*]\s+', '', text, flags=re.MULTILINE)  # List items
+    text = _BOLD_RE.sub(r'\1', text)
+    text = _ITALIC_RE.sub(r'\1', text)
+    text = _HEADER_RE.sub('', text)
+    text = _LIST_ITEM_RE.sub('', text)
 
     # Collapse whitespace
-    text = re.sub(r'\n{2,}', '\n', text)
-    text = re.sub(r' {2,}', ' ', text)
+    text = _BLANK_LINES_RE.sub('\n', text)
+    text = _SPACES_RE.sub(' ', text)
+
+    return text
+
 
-    return text.strip()
+def filter_for_summarization(text: str) -> str:
+    """Remove code, paths, and technical noise before summarization."""
+    if not text:
+        return text
+    return _strip_technical_noise(text).strip()
+
+
+def filter_for_summarization_batch(texts: list[str]) -> list[str]:
+    """Filter several texts with one pass of each regex.
+
+    Equivalent to calling filter_for_summarization on each text. The texts
+    are joined with a NUL separator and split again afterwards, so they must
+    not contain NUL themselves; if any does, each text is filtered
+    separately instead.
+    """
+    if not texts:
+        return []
+    if any(_BATCH_SEP in text for text in texts):
+        return [filter_for_summarization(text) for text in texts]
+    joined = _strip_technical_noise(_BATCH_SEP.join(texts))
+    return [part.strip() for part in joined.split(_BATCH_SEP)]
 
 
 class ResponseSummarizer:
@@ -150,10 +198,15 @@ class ResponseSummarizer:
         if not self._ready:
             return None
 
+        # Short text: speak directly without filtering or summarizing
+        if len(text) < MIN_TEXT_LENGTH:
+            text = text.strip()
+            return text if text else None
+
         # Filter technical content first
         filtered = filter_for_summarization(text)
 
-        # Short text: speak directly without summarizing
+        # Short after filtering (e.g. mostly code): speak what's left directly
         if len(filtered) < MIN_TEXT_LENGTH:
             return filtered if filtered else None
 
@@ -192,14 +245,14 @@ Summary:'''
                 return None
 
             # Strip common LLM preamble prefixes
-            for prefix in ("summary:", "output:", "here's", "sure,", "sure!", "sure.",
-                           "here is", "here are"):
-                if summary.lower().startswith(prefix):
+            lowered = summary.lower()
+            for prefix in _PREAMBLE_PREFIXES:
+                if lowered.startswith(prefix):
                     summary = summary[len(prefix):].strip()
+                    lowered = summary.lower()
 
             # Strip surrounding quotes if LLM added them
-            if (summary.startswith('"') and summary.endswith('"')) or \
-               (summary.startswith("'") and summary.endswith("'")):
+            if summary[:1] in ('"', "'") and summary[-1:] == summary[:1]:
                 summary = summary[1:-1]
 
             return summary if summary else None
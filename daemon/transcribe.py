@@ -1,5 +1,6 @@
 """Transcription functionality for Claude Voice daemon (Whisper + Parakeet backends)."""
 
+import functools
 import os
 import re
 import time
@@ -34,17 +35,61 @@ def strip_filler_words(text: str) -> str:
     return text
 
 
+def _trie_pattern(words) -> str:
+    """Build a regex alternation for words with common prefixes factored out.
+
+    A plain "a|b|c" alternation retries every rule at every position; the
+    trie form only follows branches that match the text so far. Optional
+    tails are greedy, so the longest phrase still wins. The pattern keeps
+    the words' own characters (for use with re.IGNORECASE); characters that
+    casefold to the same single character share a branch.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            folded = ch.casefold()
+            key = folded if len(folded) == 1 else ch
+            entry = node.setdefault(key, (ch, {}))
+            node = entry[1]
+        node[""] = None  # End of a word
+
+    def build(node) -> str:
+        branches = [re.escape(entry[0]) + build(entry[1])
+                    for key, entry in sorted(node.items()) if key]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_replacements(rules: tuple) -> tuple[re.Pattern, dict]:
+    """Build one trie-shaped pattern and a casefolded lookup for (wrong, correct) rules."""
+    mapping = {}
+    for wrong, correct in rules:
+        mapping.setdefault(wrong.casefold(), correct)
+    pattern = re.compile(r'\b' + _trie_pattern(wrong for wrong, _ in rules) + r'\b',
+                         re.IGNORECASE)
+    return pattern, mapping
+
+
 def apply_word_replacements(text: str, replacements: dict) -> str:
     """Apply word replacements to transcribed text.
 
     Uses whole-word matching (word boundaries) and case-insensitive matching.
-    Multi-word phrases are supported.
+    Multi-word phrases are supported. All rules are applied in a single pass,
+    so replaced text is not matched again by other rules.
     """
     if not replacements or not text:
         return text
-    for wrong, correct in replacements.items():
-        text = re.sub(r'\b' + re.escape(wrong) + r'\b', correct, text, flags=re.IGNORECASE)
-    return text
+    pattern, mapping = _compile_replacements(tuple(replacements.items()))
+    # IGNORECASE can match spellings whose casefold differs from the rule
+    # key; leave those as spoken rather than fail
+    return pattern.sub(lambda m: mapping.get(m.group(0).casefold(), m.group(0)), text)
+
 
 class Transcriber:
     """Transcribes audio using Whisper (faster-whisper or MLX backend)."""
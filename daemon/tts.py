@@ -1,7 +1,9 @@
 """TTS engine backends: Kokoro (local) and OpenAI (cloud)."""
 
+import contextlib
 import logging
 import os
+import queue
 import subprocess
 import tempfile
 import threading
@@ -12,6 +14,41 @@ logging.getLogger("phonemizer").setLevel(logging.ERROR)
 KOKORO_MODEL = "mlx-community/Kokoro-82M-bf16"
 SAMPLE_RATE = 24000
 
+# Temp WAV files go to RAM-backed /dev/shm where it exists (Linux); macOS
+# has no /dev/shm and uses the default temp dir
+_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Read size when streaming OpenAI TTS audio (bytes)
+_STREAM_CHUNK_SIZE = 64 * 1024
+# Read size for streamed PCM playback (~85ms at 24kHz 16-bit mono). Small
+# reads let playback start on the first bytes and bound stop latency.
+_PCM_CHUNK_SIZE = 4096
+
+
+# HTTP status -> (log reason, error event message, error event code,
+# overrides). Overrides are (body marker, message, code) tuples; the first
+# whose marker appears in the response body replaces the message and code.
+_HTTP_ERRORS = {
+    401: ("invalid API key", "Invalid OpenAI API key", "invalid_key", ()),
+    429: ("rejected", "OpenAI rate limited", "rate_limited", (
+        ("insufficient_quota", "Insufficient credits \u2014 check OpenAI billing", "insufficient_quota"),
+    )),
+}
+
+
+def _open_pcm_stream():
+    """Open an output stream for OpenAI's raw PCM format (24kHz 16-bit mono).
+
+    afplay can only play seekable files, so streamed playback goes through
+    sounddevice. Returns None if no output stream can be opened.
+    """
+    try:
+        import sounddevice as sd
+        return sd.RawOutputStream(samplerate=SAMPLE_RATE, channels=1, dtype="int16")
+    except Exception as e:
+        print(f"OpenAI TTS: streaming playback unavailable ({e}), using afplay")
+        return None
+
 
 class KokoroTTSEngine:
     """Kokoro text-to-speech engine. Lazy-loads model on first use."""
@@ -71,7 +108,7 @@ class KokoroTTSEngine:
             mx.metal.clear_cache()
 
             # Write to temp WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
+            with tempfile.NamedTemporaryFile(suffix='.wav', dir=_TMP_DIR, delete=False) as tmp:
                 tmp_path = tmp.name
 
             sf.write(tmp_path, audio_np, SAMPLE_RATE)
@@ -109,35 +146,99 @@ TTSEngine = KokoroTTSEngine
 class OpenAITTSEngine:
     """OpenAI cloud text-to-speech engine."""
 
+    # OPENAI_API_KEY from the environment, read once per process
+    _ENV_KEY_CACHE: str | None = None
+
     def __init__(self, api_key: str = "", model: str = "tts-1"):
-        self._api_key = api_key or os.environ.get("OPENAI_API_KEY", "")
+        self._api_key = api_key or self._get_env_key()
         self._model = model
         self._lock = threading.Lock()
         self._playback_proc = None
+        self._playback_stream = None
+        self._closed = False  # Set by close(); no new session or events after
+        self._session = None  # requests.Session, created on first speak()
         self._error_active = False
         self._emit = None
+        self._events = None  # queue.Queue drained by the event thread
+
+    @classmethod
+    def _get_env_key(cls) -> str:
+        """Return OPENAI_API_KEY from the environment (cached after first read)."""
+        if cls._ENV_KEY_CACHE is None:
+            cls._ENV_KEY_CACHE = os.environ.get("OPENAI_API_KEY", "")
+        return cls._ENV_KEY_CACHE
 
     def set_emitter(self, fn):
         """Wire up the event callback for error reporting."""
         self._emit = fn
 
+    def _post_event(self, event: dict) -> None:
+        """Queue an event for the emitter without blocking speak().
+
+        The emitter writes to control-socket subscribers, so it runs on its
+        own thread (started on first use) to keep slow clients off the
+        speech path. Events are dropped once the engine is closed.
+        """
+        if not self._emit:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            if self._events is None:
+                self._events = queue.Queue()
+                threading.Thread(target=self._drain_events, args=(self._events,),
+                                 daemon=True, name="tts-events").start()
+            events = self._events
+        events.put_nowait(event)
+
+    def _drain_events(self, events: queue.Queue) -> None:
+        """Deliver queued events until a None sentinel arrives."""
+        while True:
+            event = events.get()
+            try:
+                if event is None:
+                    return
+                emit = self._emit
+                if emit:
+                    emit(event)
+            except Exception as e:
+                print(f"OpenAI TTS: event emit failed: {e}")
+            finally:
+                events.task_done()
+
     def _report_error(self, message: str, code: str):
         """Emit an error event (deduplicated — only on first failure)."""
         if not self._error_active:
             self._error_active = True
-            if self._emit:
-                self._emit({"event": "error", "source": "openai_tts", "message": message, "code": code})
+            self._post_event({"event": "error", "source": "openai_tts", "message": message, "code": code})
 
     def _clear_error(self):
         """Emit an error_cleared event (only if currently in error state)."""
         if self._error_active:
             self._error_active = False
-            if self._emit:
-                self._emit({"event": "error_cleared", "source": "openai_tts"})
+            self._post_event({"event": "error_cleared", "source": "openai_tts"})
 
     def _ensure_model(self):
-        """No-op — no local model to load."""
-        pass
+        """No local model; create the HTTP session up front.
+
+        The output stream is still opened per utterance so playback follows
+        the current default output device.
+        """
+        self._get_session()
+
+    def _get_session(self):
+        """Return the pooled requests.Session, creating it on first use.
+
+        Reusing one session keeps the HTTPS connection alive between
+        utterances. Returns None once the engine is closed.
+        """
+        import requests
+        with self._lock:
+            if self._closed:
+                return None
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
 
     def speak(self, text: str, voice: str = "af_heart", speed: float = 1.0, lang_code: str = "a") -> None:
         """Generate speech via OpenAI API and play it.
@@ -156,11 +257,20 @@ class OpenAITTSEngine:
             self._report_error("No OpenAI API key configured", "no_api_key")
             return
 
+        # Get the output stream before the request so playback can start
+        # as soon as the first audio arrives
+        stream = _open_pcm_stream()
         tmp_path = None
         try:
             import requests
 
-            response = requests.post(
+            session = self._get_session()
+            if session is None:
+                return  # Engine closed (replaced by reload_config)
+
+            # Closing the response on every path (including an aborted
+            # playback) returns or drops the connection deliberately
+            with contextlib.closing(session.post(
                 "https://api.openai.com/v1/audio/speech",
                 headers={
                     "Authorization": f"Bearer {self._api_key}",
@@ -170,23 +280,31 @@ class OpenAITTSEngine:
                     "input": text,
                     "voice": voice,
                     "speed": speed,
-                    "response_format": "wav",
+                    "response_format": "pcm" if stream is not None else "wav",
                 },
                 timeout=30,
-            )
-            response.raise_for_status()
-
-            # Write to temp WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                tmp.write(response.content)
-                tmp_path = tmp.name
-
-            proc = subprocess.Popen(['afplay', tmp_path])
-            with self._lock:
-                self._playback_proc = proc
-            proc.wait()
-            with self._lock:
-                self._playback_proc = None
+                stream=True,
+            )) as response:
+                if not response.ok:
+                    response.content  # Read the error body before it is closed
+                response.raise_for_status()
+
+                if stream is not None:
+                    pcm_stream, stream = stream, None  # _play_pcm closes it
+                    self._play_pcm(pcm_stream, response)
+                else:
+                    # Stream the body into a temp WAV file as it arrives
+                    with tempfile.NamedTemporaryFile(suffix='.wav', dir=_TMP_DIR, delete=False) as tmp:
+                        tmp_path = tmp.name
+                        for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                            tmp.write(chunk)
+
+                    proc = subprocess.Popen(['afplay', tmp_path])
+                    with self._lock:
+                        self._playback_proc = proc
+                    proc.wait()
+                    with self._lock:
+                        self._playback_proc = None
 
             self._clear_error()
 
@@ -202,19 +320,19 @@ class OpenAITTSEngine:
                     detail = body.get("error", {}).get("message", e.response.text)
                 except Exception:
                     detail = e.response.text
-            if status == 401:
-                print(f"OpenAI TTS error: invalid API key (HTTP 401): {detail}")
-                self._report_error("Invalid OpenAI API key", "invalid_key")
-            elif status == 429:
-                print(f"OpenAI TTS error: rejected (HTTP 429): {detail}")
-                body_text = e.response.text if e.response is not None else ""
-                if "insufficient_quota" in body_text:
-                    self._report_error("Insufficient credits \u2014 check OpenAI billing", "insufficient_quota")
-                else:
-                    self._report_error("OpenAI rate limited", "rate_limited")
-            else:
+            known = _HTTP_ERRORS.get(status)
+            if known is None:
                 print(f"OpenAI TTS error: HTTP {status}: {detail}")
                 self._report_error(f"OpenAI TTS error: HTTP {status}", "unknown")
+            else:
+                reason, message, code, overrides = known
+                print(f"OpenAI TTS error: {reason} (HTTP {status}): {detail}")
+                body_text = e.response.text if e.response is not None else ""
+                for marker, override_message, override_code in overrides:
+                    if marker in body_text:
+                        message, code = override_message, override_code
+                        break
+                self._report_error(message, code)
         except requests.ConnectionError:
             print("OpenAI TTS error: cannot reach api.openai.com")
             self._report_error("Cannot reach OpenAI API", "network_error")
@@ -222,19 +340,86 @@ class OpenAITTSEngine:
             print(f"OpenAI TTS error: {type(e).__name__}: {e}")
             self._report_error(f"OpenAI TTS error: {e}", "unknown")
         finally:
+            if stream is not None:
+                stream.close()
             if tmp_path:
                 try:
                     os.unlink(tmp_path)
                 except OSError:
                     pass
 
+    def _play_pcm(self, stream, response) -> None:
+        """Play 16-bit PCM from a streamed response while it downloads.
+
+        Closes the stream when done. stop_playback() detaches the stream;
+        the next write then aborts it instead of playing on.
+        """
+        with self._lock:
+            self._playback_stream = stream
+        try:
+            stream.start()
+            pending = b""
+            for chunk in response.iter_content(chunk_size=_PCM_CHUNK_SIZE):
+                with self._lock:
+                    if self._playback_stream is not stream:
+                        stream.abort()
+                        return
+                pending += chunk
+                # Only whole 16-bit samples can be written
+                usable = len(pending) - len(pending) % 2
+                if usable:
+                    stream.write(pending[:usable])
+                    pending = pending[usable:]
+            stream.stop()  # Waits for buffered audio to finish
+        finally:
+            with self._lock:
+                if self._playback_stream is stream:
+                    self._playback_stream = None
+            stream.close()
+
     def stop_playback(self) -> bool:
         """Stop current audio playback. Returns True if playback was active."""
         from daemon import kill_playback_proc
         with self._lock:
             proc = self._playback_proc
             self._playback_proc = None
-        return kill_playback_proc(proc)
+            stream = self._playback_stream
+            self._playback_stream = None
+        return kill_playback_proc(proc) or stream is not None
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and stop the event thread once
+        queued events are delivered.
+
+        The engine is not reused afterwards: no new session or event thread
+        is started.
+        """
+        with self._lock:
+            self._closed = True
+            session, self._session = self._session, None
+            events, self._events = self._events, None
+        if events is not None:
+            events.put_nowait(None)
+        if session is not None:
+            session.close()
+
+
+def _make_kokoro(**kwargs) -> KokoroTTSEngine:
+    return KokoroTTSEngine()
+
+
+def _make_openai(**kwargs) -> OpenAITTSEngine:
+    return OpenAITTSEngine(
+        api_key=kwargs.get("api_key", ""),
+        model=kwargs.get("model", "tts-1"),
+    )
+
+
+# Engine name -> factory taking create_tts_engine's kwargs
+_ENGINE_FACTORIES = {
+    "kokoro": _make_kokoro,
+    "openai": _make_openai,
+}
 
 
 def create_tts_engine(engine: str = "kokoro", **kwargs):
@@ -244,12 +429,9 @@ def create_tts_engine(engine: str = "kokoro", **kwargs):
         engine: "kokoro" or "openai"
         **kwargs: Passed to engine constructor (api_key, model for OpenAI)
     """
-    if engine == "openai":
-        return OpenAITTSEngine(
-            api_key=kwargs.get("api_key", ""),
-            model=kwargs.get("model", "tts-1"),
-        )
-    if engine != "kokoro":
+    factory = _ENGINE_FACTORIES.get(engine)
+    if factory is None:
         print(f"WARNING: Unknown TTS engine '{engine}', falling back to kokoro. "
-              f"Valid engines: kokoro, openai")
-    return KokoroTTSEngine()
+              f"Valid engines: {', '.join(_ENGINE_FACTORIES)}")
+        factory = _make_kokoro
+    return factory(**kwargs)
@@ -9,6 +9,27 @@ import re
 import sys
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(line):
+    """Parse one JSON line, with orjson when available.
+
+    orjson is stricter than json (it rejects lone surrogate escapes, which
+    JSON.stringify writes for a split emoji, and NaN), so lines it refuses
+    are retried with the stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
 # Allow importing _common from the same directory
 sys.path.insert(0, os.path.dirname(__file__))
 from _common import SILENT_FLAG, send_to_daemon
@@ -81,7 +102,7 @@ def extract_last_assistant_message(transcript_path: str, skip_tool_results: bool
     with open(transcript_path, 'r') as f:
         for line in f:
             try:
-                entry = json.loads(line)
+                entry = _loads(line)
                 if entry.get('type') == 'assistant':
                     # Get text content from message
                     message = entry.get('message', {})
@@ -109,28 +130,43 @@ def extract_last_assistant_message(transcript_path: str, skip_tool_results: bool
 
                     if text_parts:
                         last_message = '\n'.join(text_parts)
-            except json.JSONDecodeError:
+            except ValueError:  # json/orjson JSONDecodeError
                 continue
 
     return last_message
 
+# Characters that can start a markdown construct stripped by clean_text_for_speech
+_MARKDOWN_CHARS = frozenset("`*#[-")
+
+# Pre-compiled cleanup patterns
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_HEADER_RE = re.compile(r'^#+\s*', re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r'^\s*[-*]\s+', re.MULTILINE)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
 def clean_text_for_speech(text: str, config: dict) -> str:
     """Clean text for TTS - remove code blocks, markdown, etc."""
 
-    # Remove code blocks if configured
-    if config.get('skip_code_blocks', True):
-        text = re.sub(r'```[\s\S]*?```', ' [code block omitted] ', text)
-        text = re.sub(r'`[^`]+`', '', text)
+    # Plain prose has no markdown markers: skip straight to whitespace cleanup
+    if not _MARKDOWN_CHARS.isdisjoint(text):
+        # Remove code blocks if configured
+        if config.get('skip_code_blocks', True):
+            text = _CODE_BLOCK_RE.sub(' [code block omitted] ', text)
+            text = _INLINE_CODE_RE.sub('', text)
 
-    # Remove markdown formatting
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-    text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)  # Headers
-    text = re.sub(r'^\s*[-*]\s+', '', text, flags=re.MULTILINE)  # List items
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)  # Links
+        # Remove markdown formatting
+        text = _BOLD_RE.sub(r'\1', text)
+        text = _ITALIC_RE.sub(r'\1', text)
+        text = _HEADER_RE.sub('', text)
+        text = _LIST_ITEM_RE.sub('', text)
+        text = _LINK_RE.sub(r'\1', text)
 
     # Clean up whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     text = text.strip()
 
     # Limit length if configured
@@ -221,7 +221,7 @@ if [ "$IS_UPDATE" = true ]; then
 else
     _spin_run "Installing Python dependencies" pip install --upgrade pip -q
 fi
-_spin_run "Installing core dependencies" pip install --upgrade --only-binary av pynput sounddevice pyyaml mlx-audio "misaki<0.8" num2words phonemizer spacy espeakng-loader pyobjc-framework-Cocoa pyobjc-framework-Quartz -q
+_spin_run "Installing core dependencies" pip install --upgrade --only-binary av pynput sounddevice pyyaml orjson mlx-audio "misaki<0.8" num2words phonemizer spacy espeakng-loader pyobjc-framework-Cocoa pyobjc-framework-Quartz -q
 if ! python3 -c "import en_core_web_sm" 2>/dev/null; then
     _spin_run "Downloading spacy English model" python3 -m spacy download en_core_web_sm -q
 fi
@@ -0,0 +1,49 @@
+"""Shared fixtures for unit tests."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from daemon.summarize import ResponseSummarizer
+from daemon.tts import OpenAITTSEngine
+
+
+@pytest.fixture(scope="class")
+def ready_summarizer():
+    """A ResponseSummarizer that skips the Ollama readiness check.
+
+    Shared by the tests in a class; summarize() does not mutate it.
+    """
+    summarizer = ResponseSummarizer()
+    summarizer._ready = True
+    return summarizer
+
+
+@pytest.fixture
+def mock_run(monkeypatch):
+    """Patch subprocess.run in daemon.summarize.
+
+    Returns the mock; call ``mock_run.result(stdout, returncode=0)`` to set
+    the CompletedProcess-like value it returns.
+    """
+    run = MagicMock()
+
+    def result(stdout: str = "", returncode: int = 0):
+        run.return_value = SimpleNamespace(returncode=returncode, stdout=stdout)
+        return run
+
+    run.result = result
+    monkeypatch.setattr("daemon.summarize.subprocess.run", run)
+    return run
+
+
+@pytest.fixture
+def openai_engine():
+    """An OpenAITTSEngine with a test API key, closed after the test.
+
+    Closing releases its HTTP session and stops its event thread.
+    """
+    engine = OpenAITTSEngine(api_key="sk-test")
+    yield engine
+    engine.close()
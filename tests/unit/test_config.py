@@ -5,8 +5,11 @@ from daemon.config import (
     SpeechConfig, AudioConfig, OverlayConfig, load_config,
     DEFAULT_NOTIFY_PHRASES,
 )
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch, mock_open
 
+import pytest
+
 
 class TestLoadConfig:
 
@@ -130,3 +133,14 @@ transcription:
             with patch("builtins.open", mock_open(read_data=yaml_content)):
                 cfg = load_config()
         assert cfg.transcription.language_backends == {}
+
+    def test_config_sections_are_immutable(self):
+        with patch("daemon.config.os.path.exists", return_value=False):
+            cfg = load_config()
+        with pytest.raises(FrozenInstanceError):
+            cfg.speech.voice = "bf_emma"
+
+    def test_default_containers_not_shared(self):
+        a, b = TranscriptionConfig(), TranscriptionConfig()
+        assert a.word_replacements == b.word_replacements
+        assert a.word_replacements is not b.word_replacements
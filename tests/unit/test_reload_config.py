@@ -498,6 +498,17 @@ class TestReloadTTSEngine:
 
         old_engine.stop_playback.assert_called_once()
 
+    def test_engine_change_closes_old_engine(self):
+        d = _make_daemon()
+        old_engine = d.tts_engine
+        new_cfg = _default_config(speech=SpeechConfig(engine="openai", openai_api_key="sk-test"))
+
+        with patch("daemon.main.load_config", return_value=new_cfg), \
+             patch("daemon.main.create_tts_engine", return_value=MagicMock()):
+            d.reload_config()
+
+        old_engine.close.assert_called_once()
+
     def test_engine_change_listed_in_summary(self, capsys):
         d = _make_daemon()
         new_cfg = _default_config(speech=SpeechConfig(engine="openai", openai_api_key="sk-test"))
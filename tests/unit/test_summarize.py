@@ -1,11 +1,15 @@
 """Unit tests for response summarization (daemon/summarize.py)."""
 
 import subprocess
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from daemon.summarize import ResponseSummarizer, filter_for_summarization, MIN_TEXT_LENGTH
+from daemon.summarize import (
+    ResponseSummarizer, filter_for_summarization, filter_for_summarization_batch,
+    MIN_TEXT_LENGTH,
+)
 
 
 class TestFilterForSummarization:
@@ -36,6 +40,12 @@ class TestFilterForSummarization:
         assert "config.py" not in result
         assert "test_foo.py" not in result
 
+    def test_removes_home_relative_paths(self):
+        text = "Edited ~/projects/app/notes.txt and restarted."
+        result = filter_for_summarization(text)
+        assert "~/projects" not in result
+        assert "restarted" in result
+
     def test_removes_stack_traces(self):
         text = "Got an error:\n  at Function.run (file.js:10)\n  File \"main.py\", line 42\nFixed it."
         result = filter_for_summarization(text)
@@ -60,90 +70,104 @@ class TestFilterForSummarization:
         assert "I fixed the login bug and added a test" in result
 
 
+class TestFilterForSummarizationBatch:
+    """Test that batch filtering matches filtering each text on its own."""
+
+    def test_matches_scalar_filter(self):
+        texts = [
+            "I added a function:\n```python\ndef foo():\n    pass\n```\nDone.",
+            "## Header\n- item one\n* item two",
+            "Unclosed ``` fence and a stray *star",
+            "closing *star and `tick",
+            "/Users/johan/project/main.py at the start",
+            "",
+            "Got an error:\n  File \"main.py\", line 42\nFixed it.",
+        ]
+        assert filter_for_summarization_batch(texts) == [
+            filter_for_summarization(t) for t in texts
+        ]
+
+    def test_empty_list(self):
+        assert filter_for_summarization_batch([]) == []
+
+    def test_text_containing_separator(self):
+        texts = ["a\x00b", "**Bold** text"]
+        assert filter_for_summarization_batch(texts) == ["a\x00b", "Bold text"]
+
+
 class TestSummarizerPostProcessing:
     """Test the output post-processing in summarize() — the pure logic part."""
 
-    def _run_summarize(self, stdout: str, style: str = "brief") -> str | None:
+    @pytest.fixture
+    def run_summarize(self, ready_summarizer, mock_run):
         """Run summarize with mocked subprocess returning given stdout."""
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = stdout
-
         # Input must be long enough to not trigger passthrough
         long_input = "This is a long enough input text that needs to be summarized properly."
 
-        with patch("daemon.summarize.subprocess.run", return_value=mock_result):
-            return summarizer.summarize(long_input, style=style)
+        def run(stdout: str, style: str = "brief") -> str | None:
+            mock_run.result(stdout)
+            return ready_summarizer.summarize(long_input, style=style)
+        return run
 
-    def test_strips_summary_prefix(self):
-        result = self._run_summarize("Summary: I fixed the bug.")
+    def test_strips_summary_prefix(self, run_summarize):
+        result = run_summarize("Summary: I fixed the bug.")
         assert result == "I fixed the bug."
 
-    def test_strips_output_prefix(self):
-        result = self._run_summarize("output: I fixed the bug.")
+    def test_strips_output_prefix(self, run_summarize):
+        result = run_summarize("output: I fixed the bug.")
         assert result == "I fixed the bug."
 
-    def test_strips_heres_prefix(self):
-        result = self._run_summarize("Here's the summary: I fixed the bug.")
+    def test_strips_heres_prefix(self, run_summarize):
+        result = run_summarize("Here's the summary: I fixed the bug.")
         assert result == "the summary: I fixed the bug."  # Only strips "here's"
 
-    def test_strips_sure_prefix(self):
-        result = self._run_summarize("Sure, here's a summary in two sentences. I fixed the bug.")
+    def test_strips_sure_prefix(self, run_summarize):
+        result = run_summarize("Sure, here's a summary in two sentences. I fixed the bug.")
         assert result == "here's a summary in two sentences. I fixed the bug."
 
-    def test_strips_double_quotes(self):
-        result = self._run_summarize('"I fixed the bug."')
+    def test_strips_chained_prefixes(self, run_summarize):
+        result = run_summarize("Sure, here is what I did: fixed the bug.")
+        assert result == "what I did: fixed the bug."
+
+    def test_strips_double_quotes(self, run_summarize):
+        result = run_summarize('"I fixed the bug."')
         assert result == "I fixed the bug."
 
-    def test_strips_single_quotes(self):
-        result = self._run_summarize("'I fixed the bug.'")
+    def test_strips_single_quotes(self, run_summarize):
+        result = run_summarize("'I fixed the bug.'")
         assert result == "I fixed the bug."
 
-    def test_passthrough_normal_text(self):
-        result = self._run_summarize("I fixed the bug.")
+    def test_keeps_mismatched_quotes(self, run_summarize):
+        result = run_summarize('"I fixed the bug.\'')
+        assert result == '"I fixed the bug.\''
+
+    def test_passthrough_normal_text(self, run_summarize):
+        result = run_summarize("I fixed the bug.")
         assert result == "I fixed the bug."
 
-    def test_empty_response_returns_none(self):
-        result = self._run_summarize("")
+    def test_empty_response_returns_none(self, run_summarize):
+        result = run_summarize("")
         assert result is None
 
-    def test_whitespace_only_returns_none(self):
-        result = self._run_summarize("   \n  ")
+    def test_whitespace_only_returns_none(self, run_summarize):
+        result = run_summarize("   \n  ")
         assert result is None
 
 
 class TestSummarizerGracefulDegradation:
     """Test that summarize() returns None on any failure (caller handles fallback)."""
 
-    def test_returns_none_on_nonzero_exit(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-
-        with patch("daemon.summarize.subprocess.run", return_value=mock_result):
-            assert summarizer.summarize("A long enough text for summarization.") is None
+    def test_returns_none_on_nonzero_exit(self, ready_summarizer, mock_run):
+        mock_run.result("", returncode=1)
+        assert ready_summarizer.summarize("A long enough text for summarization.") is None
 
-    def test_returns_none_on_timeout(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
-        with patch("daemon.summarize.subprocess.run",
-                   side_effect=subprocess.TimeoutExpired("ollama", 10)):
-            assert summarizer.summarize("A long enough text for summarization.") is None
-
-    def test_returns_none_on_exception(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
+    def test_returns_none_on_timeout(self, ready_summarizer, mock_run):
+        mock_run.side_effect = subprocess.TimeoutExpired("ollama", 10)
+        assert ready_summarizer.summarize("A long enough text for summarization.") is None
 
-        with patch("daemon.summarize.subprocess.run",
-                   side_effect=OSError("command not found")):
-            assert summarizer.summarize("A long enough text for summarization.") is None
+    def test_returns_none_on_exception(self, ready_summarizer, mock_run):
+        mock_run.side_effect = OSError("command not found")
+        assert ready_summarizer.summarize("A long enough text for summarization.") is None
 
     def test_returns_none_when_not_ready(self):
         summarizer = ResponseSummarizer()
@@ -154,149 +178,106 @@ class TestSummarizerGracefulDegradation:
 class TestShortTextPassthrough:
     """Test that short text is returned directly without LLM call."""
 
-    def test_short_text_returned_directly(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
+    def test_short_text_returned_directly(self, ready_summarizer, mock_run):
         # Should not call subprocess for short text
-        with patch("daemon.summarize.subprocess.run") as mock_run:
-            result = summarizer.summarize("Done.")
-            mock_run.assert_not_called()
-            assert result == "Done."
-
-    def test_short_filtered_text_passthrough(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
+        result = ready_summarizer.summarize("Done.")
+        mock_run.assert_not_called()
+        assert result == "Done."
+
+    def test_short_text_skips_filter(self, ready_summarizer, mock_run):
+        with patch("daemon.summarize.filter_for_summarization") as mock_filter:
+            result = ready_summarizer.summarize("  All done.  ")
+        mock_filter.assert_not_called()
+        mock_run.assert_not_called()
+        assert result == "All done."
+
+    def test_short_filtered_text_passthrough(self, ready_summarizer, mock_run):
         # After filtering code, remaining text is short
         text = "```python\nprint('hello')\n```\nDone."
 
-        with patch("daemon.summarize.subprocess.run") as mock_run:
-            result = summarizer.summarize(text)
-            mock_run.assert_not_called()
-            assert result == "Done."
-
-    def test_empty_after_filter_returns_none(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
+        result = ready_summarizer.summarize(text)
+        mock_run.assert_not_called()
+        assert result == "Done."
 
+    def test_empty_after_filter_returns_none(self, ready_summarizer, mock_run):
         # Only code, nothing left after filtering
         text = "```python\nprint('hello')\n```"
 
-        with patch("daemon.summarize.subprocess.run") as mock_run:
-            result = summarizer.summarize(text)
-            mock_run.assert_not_called()
-            assert result is None
+        result = ready_summarizer.summarize(text)
+        mock_run.assert_not_called()
+        assert result is None
 
 
 class TestStylePrompts:
     """Test that different styles use different prompts."""
 
-    def test_brief_style_prompt(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Summary"
+    @pytest.fixture
+    def prompt_for(self, ready_summarizer, monkeypatch):
+        """Summarize with the given style and return the prompt sent to Ollama."""
+        captured = []
 
-        with patch("daemon.summarize.subprocess.run", return_value=mock_result) as mock_run:
-            summarizer.summarize("A long enough text that needs summarization.", style="brief")
-            call_args = mock_run.call_args[0][0]
-            prompt = call_args[3]  # ["ollama", "run", model, prompt]
-            assert "1-2 short sentences" in prompt
+        def fake_run(cmd, **kwargs):
+            captured.append(cmd[3])  # ["ollama", "run", model, prompt]
+            return SimpleNamespace(returncode=0, stdout="Summary")
 
-    def test_conversational_style_prompt(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
+        monkeypatch.setattr("daemon.summarize.subprocess.run", fake_run)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Summary"
+        def prompt_for(style: str) -> str:
+            ready_summarizer.summarize("A long enough text that needs summarization.", style=style)
+            return captured[0]
+        return prompt_for
 
-        with patch("daemon.summarize.subprocess.run", return_value=mock_result) as mock_run:
-            summarizer.summarize("A long enough text that needs summarization.", style="conversational")
-            call_args = mock_run.call_args[0][0]
-            prompt = call_args[3]
-            assert "natural, spoken recap" in prompt
+    def test_brief_style_prompt(self, prompt_for):
+        assert "1-2 short sentences" in prompt_for("brief")
 
-    def test_bullets_style_prompt(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
+    def test_conversational_style_prompt(self, prompt_for):
+        assert "natural, spoken recap" in prompt_for("conversational")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Summary"
+    def test_bullets_style_prompt(self, prompt_for):
+        assert "bullet points" in prompt_for("bullets")
 
-        with patch("daemon.summarize.subprocess.run", return_value=mock_result) as mock_run:
-            summarizer.summarize("A long enough text that needs summarization.", style="bullets")
-            call_args = mock_run.call_args[0][0]
-            prompt = call_args[3]
-            assert "bullet points" in prompt
-
-    def test_unknown_style_defaults_to_brief(self):
-        summarizer = ResponseSummarizer()
-        summarizer._ready = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Summary"
-
-        with patch("daemon.summarize.subprocess.run", return_value=mock_result) as mock_run:
-            summarizer.summarize("A long enough text that needs summarization.", style="unknown")
-            call_args = mock_run.call_args[0][0]
-            prompt = call_args[3]
-            assert "1-2 short sentences" in prompt
+    def test_unknown_style_defaults_to_brief(self, prompt_for):
+        assert "1-2 short sentences" in prompt_for("unknown")
 
 
 class TestEnsureReady:
     """Test ensure_ready() checks with mocked subprocess."""
 
-    def test_ollama_not_installed(self):
+    def test_ollama_not_installed(self, mock_run):
         summarizer = ResponseSummarizer()
-        with patch("daemon.summarize.subprocess.run",
-                   side_effect=FileNotFoundError()):
-            assert summarizer.ensure_ready() is False
+        mock_run.side_effect = FileNotFoundError()
+        assert summarizer.ensure_ready() is False
 
-    def test_model_available(self):
+    def test_model_available(self, mock_run):
         summarizer = ResponseSummarizer(model_name="qwen2.5:1.5b")
 
         def fake_run(cmd, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            if cmd[1] == "--version":
-                result.stdout = "ollama 0.1.0"
-            elif cmd[1] == "list":
-                result.stdout = "qwen2.5:1.5b   abc123   1.0 GB"
-            return result
-
-        with patch("daemon.summarize.subprocess.run", side_effect=fake_run):
-            assert summarizer.ensure_ready() is True
-            assert summarizer._ready is True
-
-    def test_model_missing_triggers_pull(self):
+            stdout = {
+                "--version": "ollama 0.1.0",
+                "list": "qwen2.5:1.5b   abc123   1.0 GB",
+            }.get(cmd[1], "")
+            return SimpleNamespace(returncode=0, stdout=stdout)
+
+        mock_run.side_effect = fake_run
+        assert summarizer.ensure_ready() is True
+        assert summarizer._ready is True
+
+    def test_model_missing_triggers_pull(self, mock_run):
         summarizer = ResponseSummarizer(model_name="qwen2.5:1.5b")
-        call_count = 0
 
         def fake_run(cmd, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            result.returncode = 0
-            if cmd[1] == "--version":
-                result.stdout = "ollama 0.1.0"
-            elif cmd[1] == "list":
-                result.stdout = ""  # model not found
-            elif cmd[1] == "pull":
-                result.stdout = "success"
-            return result
-
-        with patch("daemon.summarize.subprocess.run", side_effect=fake_run):
-            assert summarizer.ensure_ready() is True
-        assert call_count == 3  # version + list + pull
-
-    def test_version_check_timeout(self):
+            stdout = {
+                "--version": "ollama 0.1.0",
+                "list": "",  # model not found
+                "pull": "success",
+            }.get(cmd[1], "")
+            return SimpleNamespace(returncode=0, stdout=stdout)
+
+        mock_run.side_effect = fake_run
+        assert summarizer.ensure_ready() is True
+        assert mock_run.call_count == 3  # version + list + pull
+
+    def test_version_check_timeout(self, mock_run):
         summarizer = ResponseSummarizer()
-        with patch("daemon.summarize.subprocess.run",
-                   side_effect=subprocess.TimeoutExpired("ollama", 5)):
-            assert summarizer.ensure_ready() is False
+        mock_run.side_effect = subprocess.TimeoutExpired("ollama", 5)
+        assert summarizer.ensure_ready() is False
@@ -12,7 +12,12 @@ import importlib.util
 
 
 def _load_speak_response():
-    """Load speak-response.py as a module, skipping its __main__ block."""
+    """Load speak-response.py as a module, skipping its __main__ block.
+
+    The module is cached in sys.modules so repeated loads reuse it.
+    """
+    if "speak_response" in sys.modules:
+        return sys.modules["speak_response"]
     hook_path = os.path.join(
         os.path.dirname(__file__), "..", "..", "hooks", "speak-response.py"
     )
@@ -21,7 +26,12 @@ def _load_speak_response():
     mod = importlib.util.module_from_spec(spec)
     # Prevent the module from running main() on import
     mod.__name__ = "speak_response"
-    spec.loader.exec_module(mod)
+    sys.modules["speak_response"] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except Exception:
+        del sys.modules["speak_response"]
+        raise
     return mod
 
 
@@ -91,6 +101,11 @@ class TestCleanTextForSpeech:
         assert "Line one" in result
         assert "Line two" in result
 
+    def test_plain_text_without_markdown(self):
+        text = "  All done, the tests pass.\n\n\n\nAnything else?  "
+        result = clean_text_for_speech(text, {})
+        assert result == "All done, the tests pass.\n\nAnything else?"
+
     def test_truncates_at_max_chars(self):
         text = "A" * 200
         result = clean_text_for_speech(text, {"max_chars": 50})
@@ -120,9 +135,7 @@ class TestExtractLastAssistantMessage:
     def _write_jsonl(self, tmp_path, entries):
         """Write JSONL entries to a temp file, return path."""
         path = tmp_path / "transcript.jsonl"
-        with open(path, "w") as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + "\n")
+        path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
         return str(path)
 
     def test_single_assistant_message(self, tmp_path):
@@ -194,6 +207,19 @@ class TestExtractLastAssistantMessage:
         result = extract_last_assistant_message(str(path))
         assert result == "Valid message"
 
+    def test_lone_surrogate_line_is_parsed(self, tmp_path):
+        """Lines orjson rejects (e.g. a split emoji) fall back to json."""
+        path = tmp_path / "transcript.jsonl"
+        path.write_text(
+            json.dumps({"type": "assistant", "message": {"content": [
+                {"type": "text", "text": "Old reply"}
+            ]}}) + '\n'
+            + '{"type": "assistant", "message": {"content": ['
+            '{"type": "text", "text": "New reply \\ud83d"}]}}\n'
+        )
+        result = extract_last_assistant_message(str(path))
+        assert result.startswith("New reply")
+
     def test_string_content_blocks(self, tmp_path):
         """Content blocks can be plain strings, not just dicts."""
         entries = [
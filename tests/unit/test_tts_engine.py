@@ -1,17 +1,36 @@
 """Tests for TTS engine factory and OpenAI engine in daemon/tts.py."""
 
 import subprocess
+import threading
 import requests as requests_lib
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from daemon.tts import (
     KokoroTTSEngine,
     OpenAITTSEngine,
     TTSEngine,
     create_tts_engine,
+    _PCM_CHUNK_SIZE,
 )
 
 
+@pytest.fixture(autouse=True)
+def pcm_stream():
+    """Default OpenAI playback to the afplay path; set return_value to stream."""
+    with patch("daemon.tts._open_pcm_stream", return_value=None) as mock_open:
+        yield mock_open
+
+
+@pytest.fixture(autouse=True)
+def reset_env_key_cache():
+    """Make each test re-read OPENAI_API_KEY from its (patched) environment."""
+    OpenAITTSEngine._ENV_KEY_CACHE = None
+    yield
+    OpenAITTSEngine._ENV_KEY_CACHE = None
+
+
 class TestCreateTTSEngine:
 
     def test_default_returns_kokoro(self):
@@ -49,9 +68,12 @@ class TestTTSEngineAlias:
 
 class TestOpenAITTSEngine:
 
-    def test_ensure_model_is_noop(self):
+    def test_ensure_model_creates_session_only(self, pcm_stream):
         engine = OpenAITTSEngine(api_key="sk-test")
         engine._ensure_model()  # Should not raise
+        assert engine._session is not None
+        # The output stream is opened per utterance, on the current device
+        pcm_stream.assert_not_called()
 
     def test_speak_empty_text_returns_immediately(self):
         engine = OpenAITTSEngine(api_key="sk-test")
@@ -71,13 +93,13 @@ class TestOpenAITTSEngine:
         engine = OpenAITTSEngine(api_key="sk-test123", model="tts-1-hd")
 
         mock_response = MagicMock()
-        mock_response.content = b"fake-wav-data"
+        mock_response.iter_content.return_value = [b"fake-wav-data"]
         mock_response.raise_for_status = MagicMock()
 
         mock_proc = MagicMock()
         mock_proc.wait = MagicMock()
 
-        with patch.object(requests_lib, "post", return_value=mock_response) as mock_post, \
+        with patch.object(requests_lib.Session, "post", return_value=mock_response) as mock_post, \
              patch("subprocess.Popen", return_value=mock_proc), \
              patch("os.unlink"):
             engine.speak("Hello world", voice="nova", speed=1.2)
@@ -92,6 +114,7 @@ class TestOpenAITTSEngine:
         assert body["voice"] == "nova"
         assert body["speed"] == 1.2
         assert body["response_format"] == "wav"
+        assert call_kwargs[1]["stream"] is True
 
     def test_speak_auth_error_prints_specific_message(self, capsys):
         engine = OpenAITTSEngine(api_key="sk-bad")
@@ -104,7 +127,7 @@ class TestOpenAITTSEngine:
         error = requests_lib.HTTPError(response=mock_response)
         mock_response.raise_for_status.side_effect = error
 
-        with patch.object(requests_lib, "post", return_value=mock_response):
+        with patch.object(requests_lib.Session, "post", return_value=mock_response):
             engine.speak("Hello")
 
         output = capsys.readouterr().out
@@ -123,7 +146,7 @@ class TestOpenAITTSEngine:
         error = requests_lib.HTTPError(response=mock_response)
         mock_response.raise_for_status.side_effect = error
 
-        with patch.object(requests_lib, "post", return_value=mock_response):
+        with patch.object(requests_lib.Session, "post", return_value=mock_response):
             engine.speak("Hello")
 
         output = capsys.readouterr().out
@@ -134,7 +157,7 @@ class TestOpenAITTSEngine:
     def test_speak_timeout_prints_specific_message(self, capsys):
         engine = OpenAITTSEngine(api_key="sk-test")
 
-        with patch.object(requests_lib, "post", side_effect=requests_lib.Timeout("timed out")):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout("timed out")):
             engine.speak("Hello")
 
         output = capsys.readouterr().out
@@ -143,7 +166,7 @@ class TestOpenAITTSEngine:
     def test_speak_connection_error_prints_specific_message(self, capsys):
         engine = OpenAITTSEngine(api_key="sk-test")
 
-        with patch.object(requests_lib, "post", side_effect=requests_lib.ConnectionError("no route")):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.ConnectionError("no route")):
             engine.speak("Hello")
 
         output = capsys.readouterr().out
@@ -151,14 +174,14 @@ class TestOpenAITTSEngine:
 
     def test_speak_env_var_fallback(self):
         mock_response = MagicMock()
-        mock_response.content = b"fake-wav-data"
+        mock_response.iter_content.return_value = [b"fake-wav-data"]
         mock_response.raise_for_status = MagicMock()
 
         mock_proc = MagicMock()
         mock_proc.wait = MagicMock()
 
         with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-from-env"}), \
-             patch.object(requests_lib, "post", return_value=mock_response) as mock_post, \
+             patch.object(requests_lib.Session, "post", return_value=mock_response) as mock_post, \
              patch("subprocess.Popen", return_value=mock_proc), \
              patch("os.unlink"):
             # Recreate engine to pick up env var
@@ -167,6 +190,44 @@ class TestOpenAITTSEngine:
 
         assert mock_post.call_args[1]["headers"]["Authorization"] == "Bearer sk-from-env"
 
+    def test_env_key_read_once(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-first"}):
+            OpenAITTSEngine(api_key="")
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-second"}):
+            engine = OpenAITTSEngine(api_key="")
+        assert engine._api_key == "sk-first"
+
+    def test_speak_reuses_http_session(self):
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"fake-wav-data"]
+
+        with patch.object(requests_lib.Session, "post", return_value=mock_response) as mock_post, \
+             patch("subprocess.Popen", return_value=MagicMock()), \
+             patch("os.unlink"):
+            engine.speak("One")
+            session = engine._session
+            engine.speak("Two")
+
+        assert isinstance(session, requests_lib.Session)
+        assert engine._session is session
+        assert mock_post.call_count == 2
+
+    def test_close_closes_http_session(self):
+        engine = OpenAITTSEngine(api_key="sk-test")
+        session = MagicMock()
+        engine._session = session
+
+        engine.close()
+
+        session.close.assert_called_once()
+        assert engine._session is None
+
+    def test_close_without_session(self):
+        engine = OpenAITTSEngine(api_key="sk-test")
+        engine.close()  # Should not raise
+
     def test_explicit_api_key_overrides_env_var(self):
         with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-env"}):
             engine = OpenAITTSEngine(api_key="sk-explicit")
@@ -176,10 +237,10 @@ class TestOpenAITTSEngine:
         engine = OpenAITTSEngine(api_key="sk-test")
 
         mock_response = MagicMock()
-        mock_response.content = b"fake-wav-data"
+        mock_response.iter_content.return_value = [b"fake-wav-data"]
         mock_response.raise_for_status = MagicMock()
 
-        with patch.object(requests_lib, "post", return_value=mock_response), \
+        with patch.object(requests_lib.Session, "post", return_value=mock_response), \
              patch("subprocess.Popen", side_effect=OSError("afplay not found")), \
              patch("os.unlink") as mock_unlink:
             engine.speak("Hello")
@@ -187,6 +248,40 @@ class TestOpenAITTSEngine:
         # Temp file should still be cleaned up via finally block
         mock_unlink.assert_called_once()
 
+    def test_speak_writes_temp_file_to_tmp_dir(self, tmp_path):
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"fake-wav-data"]
+
+        with patch("daemon.tts._TMP_DIR", str(tmp_path)), \
+             patch.object(requests_lib.Session, "post", return_value=mock_response), \
+             patch("subprocess.Popen", return_value=MagicMock()) as mock_popen, \
+             patch("os.unlink"):
+            engine.speak("Hello")
+
+        assert mock_popen.call_args[0][0][1].startswith(str(tmp_path))
+
+    def test_speak_writes_streamed_chunks_to_temp_file(self):
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"RIFF", b"-wav-", b"data"]
+        mock_response.raise_for_status = MagicMock()
+
+        played = []
+
+        def fake_popen(cmd, **kwargs):
+            with open(cmd[1], "rb") as f:
+                played.append(f.read())
+            return MagicMock()
+
+        with patch.object(requests_lib.Session, "post", return_value=mock_response), \
+             patch("subprocess.Popen", side_effect=fake_popen):
+            engine.speak("Hello")
+
+        assert played == [b"RIFF-wav-data"]
+
     def test_stop_playback_kills_proc(self):
         engine = OpenAITTSEngine(api_key="sk-test")
         mock_proc = MagicMock(spec=subprocess.Popen)
@@ -209,18 +304,155 @@ class TestOpenAITTSEngine:
         assert result is False
 
 
+class TestOpenAITTSStreaming:
+    """Tests for streamed PCM playback through an output stream."""
+
+    def _make_response(self, chunks):
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = chunks
+        return mock_response
+
+    def test_requests_pcm_when_stream_available(self, pcm_stream):
+        pcm_stream.return_value = MagicMock()
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        with patch.object(requests_lib.Session, "post",
+                          return_value=self._make_response([])) as mock_post, \
+             patch("subprocess.Popen") as mock_popen:
+            engine.speak("Hello")
+
+        assert mock_post.call_args[1]["json"]["response_format"] == "pcm"
+        mock_popen.assert_not_called()
+
+    def test_writes_whole_samples_as_chunks_arrive(self, pcm_stream):
+        stream = MagicMock()
+        pcm_stream.return_value = stream
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        with patch.object(requests_lib.Session, "post",
+                          return_value=self._make_response([b"abc", b"def"])) as mock_post:
+            engine.speak("Hello")
+
+        written = [c.args[0] for c in stream.write.call_args_list]
+        assert written == [b"ab", b"cdef"]
+        mock_post.return_value.iter_content.assert_called_once_with(
+            chunk_size=_PCM_CHUNK_SIZE)
+        stream.start.assert_called_once()
+        stream.stop.assert_called_once()
+        stream.close.assert_called_once()
+        assert engine._playback_stream is None
+
+    def test_stop_playback_aborts_stream(self, pcm_stream):
+        stream = MagicMock()
+        pcm_stream.return_value = stream
+        engine = OpenAITTSEngine(api_key="sk-test")
+        results = []
+
+        def chunks():
+            yield b"\x00\x00"
+            results.append(engine.stop_playback())
+            yield b"\x00\x00"
+
+        with patch.object(requests_lib.Session, "post", return_value=self._make_response(chunks())):
+            engine.speak("Hello")
+
+        assert results == [True]
+        stream.write.assert_called_once()
+        stream.abort.assert_called_once()
+        stream.stop.assert_not_called()
+        stream.close.assert_called_once()
+
+    def test_response_closed_when_playback_aborted(self, pcm_stream):
+        pcm_stream.return_value = MagicMock()
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        def chunks():
+            yield b"\x00\x00"
+            engine.stop_playback()
+            yield b"\x00\x00"
+
+        response = self._make_response(chunks())
+        with patch.object(requests_lib.Session, "post", return_value=response):
+            engine.speak("Hello")
+
+        response.close.assert_called_once()
+
+    def test_stream_opened_per_utterance(self, pcm_stream):
+        """A fresh stream per utterance follows output device changes."""
+        pcm_stream.side_effect = lambda: MagicMock()
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        with patch.object(requests_lib.Session, "post",
+                          side_effect=lambda *a, **kw: self._make_response([b"\x00\x00"])):
+            engine.speak("Hello")
+            engine.speak("Again")
+
+        assert pcm_stream.call_count == 2
+
+    def test_stream_closed_on_write_error(self, pcm_stream):
+        stream = MagicMock()
+        stream.write.side_effect = OSError("device lost")
+        pcm_stream.return_value = stream
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        with patch.object(requests_lib.Session, "post",
+                          return_value=self._make_response([b"\x00\x00"])):
+            engine.speak("Hello")
+
+        stream.close.assert_called_once()
+
+    def test_close_during_playback_closes_stream(self, pcm_stream):
+        stream = MagicMock()
+        pcm_stream.return_value = stream
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        def chunks():
+            yield b"\x00\x00"
+            # As reload_config does when replacing the engine mid-utterance
+            engine.stop_playback()
+            engine.close()
+            yield b"\x00\x00"
+
+        with patch.object(requests_lib.Session, "post", return_value=self._make_response(chunks())):
+            engine.speak("Hello")
+
+        stream.abort.assert_called_once()
+        stream.close.assert_called_once()
+
+    def test_stream_closed_on_http_error(self, pcm_stream):
+        stream = MagicMock()
+        pcm_stream.return_value = stream
+        engine = OpenAITTSEngine(api_key="sk-test")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.raise_for_status.side_effect = requests_lib.HTTPError(response=mock_response)
+
+        with patch.object(requests_lib.Session, "post", return_value=mock_response):
+            engine.speak("Hello")
+
+        stream.start.assert_not_called()
+        stream.close.assert_called_once()
+
+
 class TestOpenAITTSErrorEvents:
     """Tests for error/error_cleared event emission."""
 
-    def _make_engine(self):
-        engine = OpenAITTSEngine(api_key="sk-test")
+    @pytest.fixture
+    def emitter(self, openai_engine):
         emitter = MagicMock()
-        engine.set_emitter(emitter)
-        return engine, emitter
+        openai_engine.set_emitter(emitter)
+        return emitter
+
+    @staticmethod
+    def _flush(engine):
+        """Wait for queued events to reach the emitter."""
+        if engine._events is not None:
+            engine._events.join()
 
     def _make_success_response(self):
         mock_response = MagicMock()
-        mock_response.content = b"fake-wav-data"
+        mock_response.iter_content.return_value = [b"fake-wav-data"]
         mock_response.raise_for_status = MagicMock()
         return mock_response
 
@@ -240,34 +472,37 @@ class TestOpenAITTSErrorEvents:
         engine.set_emitter(emitter)
 
         engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_called_once_with({
             "event": "error", "source": "openai_tts",
             "message": "No OpenAI API key configured", "code": "no_api_key",
         })
 
-    def test_401_emits_invalid_key(self):
-        engine, emitter = self._make_engine()
+    def test_401_emits_invalid_key(self, openai_engine, emitter):
+        engine = openai_engine
         error, mock_resp = self._make_http_error(401, "Incorrect API key")
         mock_resp.raise_for_status.side_effect = error
 
-        with patch.object(requests_lib, "post", return_value=mock_resp):
+        with patch.object(requests_lib.Session, "post", return_value=mock_resp):
             engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_called_once_with({
             "event": "error", "source": "openai_tts",
             "message": "Invalid OpenAI API key", "code": "invalid_key",
         })
 
-    def test_429_insufficient_quota(self):
-        engine, emitter = self._make_engine()
+    def test_429_insufficient_quota(self, openai_engine, emitter):
+        engine = openai_engine
         error, mock_resp = self._make_http_error(
             429, "You exceeded your current quota", "insufficient_quota"
         )
         mock_resp.raise_for_status.side_effect = error
 
-        with patch.object(requests_lib, "post", return_value=mock_resp):
+        with patch.object(requests_lib.Session, "post", return_value=mock_resp):
             engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_called_once_with({
             "event": "error", "source": "openai_tts",
@@ -275,94 +510,165 @@ class TestOpenAITTSErrorEvents:
             "code": "insufficient_quota",
         })
 
-    def test_429_rate_limited(self):
-        engine, emitter = self._make_engine()
+    def test_429_rate_limited(self, openai_engine, emitter):
+        engine = openai_engine
         error, mock_resp = self._make_http_error(429, "Rate limit exceeded")
         mock_resp.raise_for_status.side_effect = error
 
-        with patch.object(requests_lib, "post", return_value=mock_resp):
+        with patch.object(requests_lib.Session, "post", return_value=mock_resp):
             engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_called_once_with({
             "event": "error", "source": "openai_tts",
             "message": "OpenAI rate limited", "code": "rate_limited",
         })
 
-    def test_timeout_emits_network_error(self):
-        engine, emitter = self._make_engine()
+    def test_other_http_status_emits_unknown(self, openai_engine, emitter):
+        engine = openai_engine
+        error, mock_resp = self._make_http_error(500, "Server error")
+        mock_resp.raise_for_status.side_effect = error
+
+        with patch.object(requests_lib.Session, "post", return_value=mock_resp):
+            engine.speak("Hello")
+        self._flush(engine)
+
+        emitter.assert_called_once_with({
+            "event": "error", "source": "openai_tts",
+            "message": "OpenAI TTS error: HTTP 500", "code": "unknown",
+        })
+
+    def test_timeout_emits_network_error(self, openai_engine, emitter):
+        engine = openai_engine
 
-        with patch.object(requests_lib, "post", side_effect=requests_lib.Timeout()):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout()):
             engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_called_once_with({
             "event": "error", "source": "openai_tts",
             "message": "Cannot reach OpenAI API", "code": "network_error",
         })
 
-    def test_connection_error_emits_network_error(self):
-        engine, emitter = self._make_engine()
+    def test_connection_error_emits_network_error(self, openai_engine, emitter):
+        engine = openai_engine
 
-        with patch.object(requests_lib, "post", side_effect=requests_lib.ConnectionError()):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.ConnectionError()):
             engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_called_once_with({
             "event": "error", "source": "openai_tts",
             "message": "Cannot reach OpenAI API", "code": "network_error",
         })
 
-    def test_duplicate_errors_suppressed(self):
-        engine, emitter = self._make_engine()
+    def test_duplicate_errors_suppressed(self, openai_engine, emitter):
+        engine = openai_engine
 
-        with patch.object(requests_lib, "post", side_effect=requests_lib.Timeout()):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout()):
             engine.speak("Hello")
             engine.speak("Hello again")
+        self._flush(engine)
 
         # Only one error event, not two
         emitter.assert_called_once()
 
-    def test_success_clears_error(self):
-        engine, emitter = self._make_engine()
+    def test_success_clears_error(self, openai_engine, emitter):
+        engine = openai_engine
         mock_proc = MagicMock()
         mock_proc.wait = MagicMock()
 
         # First: trigger an error
-        with patch.object(requests_lib, "post", side_effect=requests_lib.Timeout()):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout()):
             engine.speak("Hello")
+        self._flush(engine)
 
         assert engine._error_active is True
         emitter.reset_mock()
 
         # Then: succeed
         resp = self._make_success_response()
-        with patch.object(requests_lib, "post", return_value=resp), \
+        with patch.object(requests_lib.Session, "post", return_value=resp), \
              patch("subprocess.Popen", return_value=mock_proc), \
              patch("os.unlink"):
             engine.speak("Hello")
+        self._flush(engine)
 
         assert engine._error_active is False
         emitter.assert_called_once_with({
             "event": "error_cleared", "source": "openai_tts",
         })
 
-    def test_no_clear_event_without_prior_error(self):
-        engine, emitter = self._make_engine()
+    def test_no_clear_event_without_prior_error(self, openai_engine, emitter):
+        engine = openai_engine
         mock_proc = MagicMock()
         mock_proc.wait = MagicMock()
 
         resp = self._make_success_response()
-        with patch.object(requests_lib, "post", return_value=resp), \
+        with patch.object(requests_lib.Session, "post", return_value=resp), \
              patch("subprocess.Popen", return_value=mock_proc), \
              patch("os.unlink"):
             engine.speak("Hello")
+        self._flush(engine)
 
         emitter.assert_not_called()
 
-    def test_no_emitter_does_not_crash(self):
+    def test_events_delivered_off_the_speaking_thread(self, openai_engine):
+        engine = openai_engine
+        threads = []
+        engine.set_emitter(lambda event: threads.append(threading.current_thread()))
+
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout()):
+            engine.speak("Hello")
+        self._flush(engine)
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+
+    def test_close_stops_event_thread(self, openai_engine, emitter):
+        engine = openai_engine
+
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout()):
+            engine.speak("Hello")
+        events = engine._events
+        engine.close()
+        events.join()
+
+        emitter.assert_called_once()
+        assert engine._events is None
+
+    def test_no_events_after_close(self, openai_engine, emitter):
+        engine = openai_engine
+
+        def post(*args, **kwargs):
+            engine.close()  # Engine replaced while the request is in flight
+            raise requests_lib.Timeout()
+
+        with patch.object(requests_lib.Session, "post", side_effect=post):
+            engine.speak("Hello")
+
+        emitter.assert_not_called()
+        assert engine._events is None
+        assert engine._session is None
+
+    def test_speak_after_close_does_not_reopen_session(self, openai_engine, emitter):
+        engine = openai_engine
+        engine.close()
+
+        with patch.object(requests_lib.Session, "post") as mock_post:
+            engine.speak("Hello")
+
+        mock_post.assert_not_called()
+        emitter.assert_not_called()
+        assert engine._events is None
+        assert engine._session is None
+
+    def test_no_emitter_does_not_crash(self, openai_engine):
         """Error tracking works even without an emitter wired up."""
-        engine = OpenAITTSEngine(api_key="sk-test")
+        engine = openai_engine
         # No set_emitter call
 
-        with patch.object(requests_lib, "post", side_effect=requests_lib.Timeout()):
+        with patch.object(requests_lib.Session, "post", side_effect=requests_lib.Timeout()):
             engine.speak("Hello")  # Should not raise
 
         assert engine._error_active is True
@@ -58,6 +58,11 @@ class TestHandleVoiceCommand:
         with patch("daemon.main.SILENT_FLAG", "/tmp/test_silent"):
             assert d._handle_voice_command("stop speaking.") is True
 
+    def test_strips_surrounding_whitespace_and_punctuation(self):
+        d = self._make_daemon()
+        with patch("daemon.main.SILENT_FLAG", "/tmp/test_silent"):
+            assert d._handle_voice_command(" Stop talking! \n") is True
+
     def test_case_insensitive(self):
         d = self._make_daemon()
         with patch("daemon.main.SILENT_FLAG", "/tmp/test_silent"):
@@ -66,3 +71,17 @@ class TestHandleVoiceCommand:
     def test_empty_string_returns_false(self):
         d = self._make_daemon()
         assert d._handle_voice_command("") is False
+
+
+class TestReadMode:
+
+    def test_uses_loaded_config_without_reading_file(self):
+        config = MagicMock()
+        config.speech.mode = "narrate"
+        with patch("builtins.open") as mock_open:
+            assert _read_mode(config) == "narrate"
+        mock_open.assert_not_called()
+
+    def test_missing_config_file_defaults_to_notify(self, tmp_path):
+        with patch("os.path.expanduser", return_value=str(tmp_path / "config.yaml")):
+            assert _read_mode() == "notify"
@@ -1,6 +1,8 @@
 """Tests for transcription word replacements and filler stripping."""
 
-from daemon.transcribe import apply_word_replacements, strip_filler_words
+from daemon.transcribe import (
+    apply_word_replacements, strip_filler_words, _compile_replacements,
+)
 
 
 class TestApplyWordReplacements:
@@ -22,10 +24,20 @@ class TestApplyWordReplacements:
         result = apply_word_replacements("aftertaste is great", {"taste": "test"})
         assert result == "aftertaste is great"
 
+    def test_whole_word_only_with_shared_prefix(self):
+        replacements = {"clawed": "Claude", "claw": "clause"}
+        result = apply_word_replacements("clawing clawed claws", replacements)
+        assert result == "clawing Claude claws"
+
     def test_multi_word_phrase(self):
         result = apply_word_replacements("open clothes code now", {"clothes code": "Claude Code"})
         assert result == "open Claude Code now"
 
+    def test_many_rules_with_common_prefixes(self):
+        replacements = {f"word{i}": f"W{i}" for i in range(60)}
+        result = apply_word_replacements("word5 word50 word59 word60", replacements)
+        assert result == "W5 W50 W59 word60"
+
     def test_multiple_rules(self):
         replacements = {"taste": "test", "clawed": "Claude"}
         result = apply_word_replacements("clawed wants to taste", replacements)
@@ -47,6 +59,37 @@ class TestApplyWordReplacements:
         result = apply_word_replacements("I need to taste.", {"taste": "test"})
         assert result == "I need to test."
 
+    def test_longer_phrase_wins_over_prefix(self):
+        replacements = {"clothes": "clause", "clothes code": "Claude Code"}
+        result = apply_word_replacements("open clothes code now", replacements)
+        assert result == "open Claude Code now"
+
+    def test_long_s_matches_case_insensitively(self):
+        result = apply_word_replacements("I said ye\u017f", {"yes": "YES"})
+        assert result == "I said YES"
+
+    def test_non_ascii_key(self):
+        result = apply_word_replacements("go to \u0130stanbul now", {"\u0130stanbul": "Istanbul"})
+        assert result == "go to Istanbul now"
+
+    def test_longer_phrase_wins_across_key_case(self):
+        replacements = {"Clothes": "clause", "clothes code": "Claude Code"}
+        result = apply_word_replacements("open Clothes code now", replacements)
+        assert result == "open Claude Code now"
+
+    def test_replacement_is_literal(self):
+        result = apply_word_replacements("see path", {"path": r"C:\new"})
+        assert result == r"see C:\new"
+
+    def test_rules_compiled_once(self):
+        replacements = {"taste": "test", "clawed": "Claude"}
+        _compile_replacements.cache_clear()
+        for _ in range(3):
+            apply_word_replacements("clawed wants to taste", replacements)
+        info = _compile_replacements.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestStripFillerWords:
     """Tests for strip_filler_words function."""